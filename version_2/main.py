@@ -8,18 +8,15 @@ Author: Princess Okafor
 Version: 2.0
 """
 
-"""
-Fitness App v2.0 - Main Entry Point
-"""
+import logging
 
-from typing import Optional
-import sys
 from src.fitness_app.ui.auth_menu import AuthMenu
 from src.fitness_app.ui.main_menu import MainMenu  # ← ADD THIS IMPORT
 
 
 def main() -> None:
     """Main application entry point."""
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
     print("🚀 Starting Fitness World v2.0...")
 
     try:
@@ -49,7 +46,7 @@ def main() -> None:
 
     finally:
         print("\n🏁 Application ended.")
-        sys.exit(0)
+        raise SystemExit(0)
 
 
 if __name__ == "__main__":
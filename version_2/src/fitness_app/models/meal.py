@@ -5,9 +5,12 @@ This module contains classes for meal planning, nutrition tracking,
 and food management functionality.
 """
 
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from enum import Enum
+from types import MappingProxyType
+import sys
+
+from ..utils.dates import formatted_now, formatted_today
 
 
 class MealType(Enum):
@@ -26,6 +29,92 @@ class NutritionGoal(Enum):
     ENDURANCE = "endurance"
 
 
+# Meal types in definition order, cached to avoid repeated Enum iteration
+_MEAL_TYPES: Tuple[MealType, ...] = tuple(MealType)
+
+# Reverse lookups used when restoring plans from JSON
+_MEAL_TYPE_BY_VALUE: Dict[str, MealType] = {meal_type.value: meal_type for meal_type in _MEAL_TYPES}
+_NUTRITION_GOAL_BY_VALUE: Dict[str, NutritionGoal] = {goal.value: goal for goal in NutritionGoal}
+
+# Display names for meal types (e.g. MealType.BREAKFAST -> "Breakfast")
+_MEAL_TYPE_DISPLAY: Dict[MealType, str] = {meal_type: meal_type.value.title()
+                                           for meal_type in _MEAL_TYPES}
+
+# Meals required for a plan to count as complete
+_MAIN_MEALS = frozenset((MealType.BREAKFAST, MealType.LUNCH, MealType.DINNER))
+
+# Slot position of each meal type in MealPlan's fixed-size meal storage
+_MEAL_INDEX: Dict[MealType, int] = {meal_type: i for i, meal_type in enumerate(_MEAL_TYPES)}
+_MAIN_MEAL_INDEXES = tuple(_MEAL_INDEX[meal_type] for meal_type in _MEAL_TYPES
+                           if meal_type in _MAIN_MEALS)
+
+# Default daily calorie targets per nutrition goal
+_DEFAULT_CALORIES: Dict[NutritionGoal, int] = {
+    NutritionGoal.WEIGHT_LOSS: 1800,
+    NutritionGoal.MUSCLE_GAIN: 2500,
+    NutritionGoal.MAINTENANCE: 2200,
+    NutritionGoal.ENDURANCE: 2800
+}
+
+# (status, message template) for on-track, over-target and under-target plans
+_CALORIE_STATUSES: Tuple[Tuple[str, str], ...] = (
+    ("on_track", "🎯 Perfect! You're on track with your calorie goal!"),
+    ("over_target", "⚠️ Over target by {} calories. Consider lighter meals."),
+    ("under_target", "📈 Under target by {} calories. Add a healthy snack!")
+)
+
+# Goal-specific nutrition tips (maintenance has none)
+_GOAL_RECOMMENDATIONS: Dict[NutritionGoal, Tuple[str, ...]] = {
+    NutritionGoal.WEIGHT_LOSS: (
+        "💡 Focus on protein-rich foods to maintain muscle",
+        "🥗 Include plenty of vegetables for nutrients and fiber",
+        "💧 Drink water before meals to help with satiety"
+    ),
+    NutritionGoal.MUSCLE_GAIN: (
+        "💪 Aim for protein with every meal",
+        "🍠 Include complex carbs for energy",
+        "🥜 Add healthy fats like nuts and avocado"
+    ),
+    NutritionGoal.ENDURANCE: (
+        "⚡ Prioritize carbohydrates for sustained energy",
+        "🏃‍♀️ Consider pre and post-workout nutrition",
+        "💧 Focus on hydration throughout the day"
+    )
+}
+
+# Basic calorie estimates for common foods (per serving)
+_CALORIE_ESTIMATES: Dict[str, int] = {
+    # Breakfast items
+    "oatmeal": 150, "eggs": 140, "toast": 80, "pancakes": 200,
+    "cereal": 120, "yogurt": 100, "fruit": 80, "smoothie": 180,
+
+    # Lunch items
+    "salad": 200, "sandwich": 300, "soup": 150, "pasta": 350,
+    "rice_bowl": 400, "wrap": 280, "pizza": 450, "burger": 500,
+
+    # Dinner items
+    "chicken": 300, "fish": 250, "beef": 400, "pork": 350,
+    "vegetarian_curry": 320, "stir_fry": 280, "salmon": 300,
+
+    # Snacks
+    "apple": 80, "nuts": 180, "protein_bar": 200, "chips": 150,
+    "crackers": 120, "cheese": 100, "banana": 90
+}
+
+
+def _food_key(food_item: str) -> str:
+    """
+    Convert a food name into its _CALORIE_ESTIMATES lookup key.
+
+    Args:
+        food_item (str): Food name as entered or stored
+
+    Returns:
+        str: Lowercase, underscore-separated key
+    """
+    return food_item.strip().lower().replace(" ", "_")
+
+
 class MealPlan:
     """
     Represents a daily meal plan with nutritional information.
@@ -37,11 +126,18 @@ class MealPlan:
         day_number (int): Day number in the meal plan sequence
         date (str): Date for this meal plan
         meals (Dict[MealType, str]): Dictionary mapping meal types to food items
+            (read-only view built from the fixed-size per-meal-type storage)
         nutrition_goal (NutritionGoal): User's nutrition goal for this plan
         target_calories (Optional[int]): Target calories for the day
         notes (str): Additional notes about the meal plan
     """
 
+    __slots__ = (
+        "day_number", "date", "_meals", "nutrition_goal", "target_calories",
+        "notes", "created_time", "_clean_keys", "_meals_version", "_calorie_cache",
+        "_status_cache"
+    )
+
     def __init__(
         self,
         day_number: int,
@@ -61,12 +157,34 @@ class MealPlan:
             notes (str): Additional notes
         """
         self.day_number = day_number
-        self.date = date or datetime.now().strftime("%B %d, %Y")
-        self.meals: Dict[MealType, str] = {}
+        self.date = date or formatted_today()
+        # Food items and calorie lookup keys, indexed by _MEAL_INDEX
+        self._meals: List[Optional[str]] = [None] * len(_MEAL_INDEX)
+        self._clean_keys: List[Optional[str]] = [None] * len(_MEAL_INDEX)
         self.nutrition_goal = nutrition_goal
         self.target_calories = target_calories or self._calculate_default_calories()
         self.notes = notes
-        self.created_time = datetime.now().strftime("%I:%M %p")
+        self.created_time = formatted_now("%I:%M %p")
+
+        # Bumped on every meal change so cached calorie results can be reused
+        self._meals_version = 0
+        self._calorie_cache: Optional[Tuple[int, int]] = None
+        self._status_cache: Optional[Tuple[int, int, Dict[str, Any]]] = None
+
+    @property
+    def meals(self) -> Mapping[MealType, str]:
+        """
+        Get the planned meals keyed by meal type.
+
+        The mapping is read-only; use add_meal to change a meal so the
+        cached calorie estimates stay in sync.
+
+        Returns:
+            Mapping[MealType, str]: Read-only mapping of meal types to food items
+        """
+        return MappingProxyType({meal_type: food_item
+                                 for meal_type, food_item in zip(_MEAL_TYPES, self._meals)
+                                 if food_item is not None})
 
     def _calculate_default_calories(self) -> int:
         """
@@ -75,13 +193,7 @@ class MealPlan:
         Returns:
             int: Default calorie target
         """
-        base_calories = {
-            NutritionGoal.WEIGHT_LOSS: 1800,
-            NutritionGoal.MUSCLE_GAIN: 2500,
-            NutritionGoal.MAINTENANCE: 2200,
-            NutritionGoal.ENDURANCE: 2800
-        }
-        return base_calories[self.nutrition_goal]
+        return _DEFAULT_CALORIES[self.nutrition_goal]
 
     def add_meal(self, meal_type: MealType, food_item: str) -> None:
         """
@@ -91,7 +203,25 @@ class MealPlan:
             meal_type (MealType): Type of meal (breakfast, lunch, etc.)
             food_item (str): Name of the food item
         """
-        self.meals[meal_type] = food_item.strip().title()
+        self._set_meal_raw(meal_type, food_item.strip().title())
+
+    def _set_meal_raw(self, meal_type: MealType, food_item: str) -> None:
+        """
+        Store an already title-cased food item without re-casing it.
+
+        Used when restoring plans saved by to_dict, whose food names were
+        normalized by add_meal at the time.
+
+        Args:
+            meal_type (MealType): Type of meal (breakfast, lunch, etc.)
+            food_item (str): Normalized (stripped, title cased) food item
+        """
+        # Interned so plans loaded from disk share one copy of each food name
+        display_name = sys.intern(food_item.strip())
+        index = _MEAL_INDEX[meal_type]
+        self._meals[index] = display_name
+        self._clean_keys[index] = _food_key(display_name)
+        self._meals_version += 1
 
     def remove_meal(self, meal_type: MealType) -> bool:
         """
@@ -103,8 +233,11 @@ class MealPlan:
         Returns:
             bool: True if meal was removed, False if meal didn't exist
         """
-        if meal_type in self.meals:
-            del self.meals[meal_type]
+        index = _MEAL_INDEX[meal_type]
+        if self._meals[index] is not None:
+            self._meals[index] = None
+            self._clean_keys[index] = None
+            self._meals_version += 1
             return True
         return False
 
@@ -128,7 +261,7 @@ class MealPlan:
         Returns:
             Optional[str]: Food item or None if not set
         """
-        return self.meals.get(meal_type)
+        return self._meals[_MEAL_INDEX[meal_type]]
 
     def get_all_meals(self) -> Dict[str, str]:
         """
@@ -137,8 +270,9 @@ class MealPlan:
         Returns:
             Dict[str, str]: Dictionary mapping meal type names to food items
         """
-        return {meal_type.value.title(): food_item
-                for meal_type, food_item in self.meals.items()}
+        return {_MEAL_TYPE_DISPLAY[meal_type]: food_item
+                for meal_type, food_item in zip(_MEAL_TYPES, self._meals)
+                if food_item is not None}
 
     def is_complete(self) -> bool:
         """
@@ -147,8 +281,7 @@ class MealPlan:
         Returns:
             bool: True if all main meals are planned
         """
-        main_meals = {MealType.BREAKFAST, MealType.LUNCH, MealType.DINNER}
-        return main_meals.issubset(set(self.meals.keys()))
+        return all(self._meals[index] is not None for index in _MAIN_MEAL_INDEXES)
 
     def get_meal_count(self) -> int:
         """
@@ -157,7 +290,7 @@ class MealPlan:
         Returns:
             int: Number of meals in the plan
         """
-        return len(self.meals)
+        return len(self._meals) - self._meals.count(None)
 
     def estimate_daily_calories(self) -> int:
         """
@@ -168,33 +301,18 @@ class MealPlan:
         Returns:
             int: Estimated total daily calories
         """
-        # Basic calorie estimates for common foods (per serving)
-        calorie_estimates = {
-            # Breakfast items
-            "oatmeal": 150, "eggs": 140, "toast": 80, "pancakes": 200,
-            "cereal": 120, "yogurt": 100, "fruit": 80, "smoothie": 180,
-
-            # Lunch items
-            "salad": 200, "sandwich": 300, "soup": 150, "pasta": 350,
-            "rice_bowl": 400, "wrap": 280, "pizza": 450, "burger": 500,
-
-            # Dinner items
-            "chicken": 300, "fish": 250, "beef": 400, "pork": 350,
-            "vegetarian_curry": 320, "stir_fry": 280, "salmon": 300,
-
-            # Snacks
-            "apple": 80, "nuts": 180, "protein_bar": 200, "chips": 150,
-            "crackers": 120, "cheese": 100, "banana": 90
-        }
+        if self._calorie_cache is not None and self._calorie_cache[0] == self._meals_version:
+            return self._calorie_cache[1]
 
         total_calories = 0
-        for meal_type, food_item in self.meals.items():
-            # Clean food name for lookup
-            clean_food = food_item.lower().replace(" ", "_")
-            calories = calorie_estimates.get(
+        for clean_food in self._clean_keys:
+            if clean_food is None:
+                continue
+            calories = _CALORIE_ESTIMATES.get(
                 clean_food, 250)  # Default 250 if not found
             total_calories += calories
 
+        self._calorie_cache = (self._meals_version, total_calories)
         return total_calories
 
     def get_calorie_status(self) -> Dict[str, Any]:
@@ -204,20 +322,21 @@ class MealPlan:
         Returns:
             Dict[str, Any]: Calorie status information
         """
+        cache = self._status_cache
+        if (cache is not None and cache[0] == self._meals_version
+                and cache[1] == self.target_calories):
+            return cache[2].copy()
+
         estimated_calories = self.estimate_daily_calories()
         difference = estimated_calories - self.target_calories
 
-        if abs(difference) <= 100:
-            status = "on_track"
-            message = "🎯 Perfect! You're on track with your calorie goal!"
-        elif difference > 100:
-            status = "over_target"
-            message = f"⚠️ Over target by {difference} calories. Consider lighter meals."
-        else:
-            status = "under_target"
-            message = f"📈 Under target by {abs(difference)} calories. Add a healthy snack!"
+        # 0 = within 100 calories, 1 = over, 2 = under
+        bucket = 0 if abs(difference) <= 100 else (1 if difference > 0 else 2)
+        status, message = _CALORIE_STATUSES[bucket]
+        if bucket:
+            message = message.format(abs(difference))
 
-        return {
+        calorie_status = {
             "estimated_calories": estimated_calories,
             "target_calories": self.target_calories,
             "difference": difference,
@@ -225,6 +344,8 @@ class MealPlan:
             "message": message,
             "percentage_of_target": round((estimated_calories / self.target_calories) * 100, 1)
         }
+        self._status_cache = (self._meals_version, self.target_calories, calorie_status)
+        return calorie_status.copy()
 
     def get_nutrition_recommendations(self) -> List[str]:
         """
@@ -233,29 +354,11 @@ class MealPlan:
         Returns:
             List[str]: List of nutrition recommendations
         """
-        recommendations = []
         calorie_status = self.get_calorie_status()
         meal_count = self.get_meal_count()
 
         # Goal-specific recommendations
-        if self.nutrition_goal == NutritionGoal.WEIGHT_LOSS:
-            recommendations.extend([
-                "💡 Focus on protein-rich foods to maintain muscle",
-                "🥗 Include plenty of vegetables for nutrients and fiber",
-                "💧 Drink water before meals to help with satiety"
-            ])
-        elif self.nutrition_goal == NutritionGoal.MUSCLE_GAIN:
-            recommendations.extend([
-                "💪 Aim for protein with every meal",
-                "🍠 Include complex carbs for energy",
-                "🥜 Add healthy fats like nuts and avocado"
-            ])
-        elif self.nutrition_goal == NutritionGoal.ENDURANCE:
-            recommendations.extend([
-                "⚡ Prioritize carbohydrates for sustained energy",
-                "🏃‍♀️ Consider pre and post-workout nutrition",
-                "💧 Focus on hydration throughout the day"
-            ])
+        recommendations = list(_GOAL_RECOMMENDATIONS.get(self.nutrition_goal, ()))
 
         # Meal count recommendations
         if meal_count < 3:
@@ -307,10 +410,9 @@ class MealPlan:
         Returns:
             List[str]: List of missing meal type names
         """
-        main_meals = {MealType.BREAKFAST, MealType.LUNCH, MealType.DINNER}
-        planned_meals = set(self.meals.keys())
-        missing = main_meals - planned_meals
-        return [meal.value.title() for meal in missing]
+        return [_MEAL_TYPE_DISPLAY[meal_type]
+                for meal_type, food_item in zip(_MEAL_TYPES, self._meals)
+                if meal_type in _MAIN_MEALS and food_item is None]
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -322,13 +424,29 @@ class MealPlan:
         return {
             "day": self.day_number,
             "date": self.date,
-            "meals": {meal_type.value: food_item for meal_type, food_item in self.meals.items()},
+            "meals": {meal_type.value: food_item
+                      for meal_type, food_item in zip(_MEAL_TYPES, self._meals)
+                      if food_item is not None},
             "nutrition_goal": self.nutrition_goal.value,
             "target_calories": self.target_calories,
             "notes": self.notes,
             "created_time": self.created_time
         }
 
+    @staticmethod
+    def estimate_calories_from_dict(data: Dict[str, Any]) -> int:
+        """
+        Estimate daily calories for a serialized meal plan without rebuilding it.
+
+        Args:
+            data (Dict[str, Any]): Dictionary in the format produced by to_dict
+
+        Returns:
+            int: Estimated total daily calories
+        """
+        return sum(_CALORIE_ESTIMATES.get(_food_key(food_item), 250)
+                   for food_item in data.get("meals", {}).values())
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'MealPlan':
         """
@@ -343,8 +461,8 @@ class MealPlan:
         meal_plan = cls(
             day_number=data["day"],
             date=data.get("date"),
-            nutrition_goal=NutritionGoal(
-                data.get("nutrition_goal", "maintenance")),
+            nutrition_goal=_NUTRITION_GOAL_BY_VALUE[
+                data.get("nutrition_goal", "maintenance")],
             target_calories=data.get("target_calories"),
             notes=data.get("notes", "")
         )
@@ -352,8 +470,8 @@ class MealPlan:
         # Restore meals
         meals_data = data.get("meals", {})
         for meal_type_str, food_item in meals_data.items():
-            meal_type = MealType(meal_type_str)
-            meal_plan.add_meal(meal_type, food_item)
+            meal_type = _MEAL_TYPE_BY_VALUE[meal_type_str]
+            meal_plan._set_meal_raw(meal_type, food_item)
 
         # Restore created time
         meal_plan.created_time = data.get(
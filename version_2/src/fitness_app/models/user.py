@@ -5,8 +5,11 @@ This module contains the User class that represents a fitness app user
 with their profile information, goals, and tracking capabilities.
 """
 
-from typing import List, Dict, Optional, Any
-from datetime import datetime
+from typing import List, Dict, Optional, Any, Tuple
+from collections import Counter
+
+from ..utils.dates import formatted_now, formatted_today
+from .meal import MealPlan
 
 
 class User:
@@ -29,6 +32,11 @@ class User:
         last_login (str): Last login timestamp
     """
 
+    __slots__ = (
+        "username", "name", "age", "weight", "target_weight", "weekly_workout_goal",
+        "workouts", "meals", "created_date", "last_login"
+    )
+
     def __init__(
         self,
         username: str,
@@ -65,27 +73,31 @@ class User:
         self.weekly_workout_goal = weekly_workout_goal
         self.workouts = workouts if workouts is not None else []
         self.meals = meals if meals is not None else []
-        self.created_date = created_date or datetime.now().strftime("%B %d, %Y")
-        self.last_login = last_login or datetime.now().strftime("%B %d, %Y at %I:%M %p")
+        self.created_date = created_date or formatted_today()
+        self.last_login = last_login or formatted_now("%B %d, %Y at %I:%M %p")
 
-    def add_workout(self, workout_data: Dict[str, Any]) -> None:
+    def add_workout(self, workout_data: Dict[str, Any], *, copy: bool = True) -> None:
         """
         Add a completed workout to user's history.
 
         Args:
             workout_data (Dict[str, Any]): Workout information containing
                 type, category, duration, intensity, and date
+            copy (bool): Store a copy of workout_data. Pass False when the
+                caller hands over ownership (e.g. bulk imports). Defaults to True
         """
-        self.workouts.append(workout_data.copy())
+        self.workouts.append(workout_data.copy() if copy else workout_data)
 
-    def add_meal_plan(self, meal_plan_data: Dict[str, Any]) -> None:
+    def add_meal_plan(self, meal_plan_data: Dict[str, Any], *, copy: bool = True) -> None:
         """
         Add a meal plan to user's saved plans.
 
         Args:
             meal_plan_data (Dict[str, Any]): Meal plan information
+            copy (bool): Store a copy of meal_plan_data. Pass False when the
+                caller hands over ownership (e.g. bulk imports). Defaults to True
         """
-        self.meals.append(meal_plan_data.copy())
+        self.meals.append(meal_plan_data.copy() if copy else meal_plan_data)
 
     def update_weight(self, new_weight: float) -> None:
         """
@@ -96,6 +108,20 @@ class User:
         """
         self.weight = new_weight
 
+    def _aggregate_workouts(self) -> Tuple[int, Dict[str, int]]:
+        """
+        Compute total workout time and per-category counts in a single pass.
+
+        Returns:
+            Tuple[int, Dict[str, int]]: (total minutes, category counts)
+        """
+        total_time = 0
+        category_counts = Counter()
+        for workout in self.workouts:
+            total_time += workout.get('duration', 0)
+            category_counts[workout.get('category', 'unknown')] += 1
+        return total_time, dict(category_counts)
+
     def get_total_workout_time(self) -> int:
         """
         Calculate total workout time across all logged workouts.
@@ -112,11 +138,19 @@ class User:
         Returns:
             Dict[str, int]: Dictionary mapping category names to workout counts
         """
-        category_counts = {}
-        for workout in self.workouts:
-            category = workout.get('category', 'unknown')
-            category_counts[category] = category_counts.get(category, 0) + 1
-        return category_counts
+        return dict(Counter(workout.get('category', 'unknown') for workout in self.workouts))
+
+    def get_total_meal_calories(self) -> int:
+        """
+        Calculate estimated calories across all saved meal plans.
+
+        Plans are estimated straight from their saved dictionaries, without
+        building a MealPlan for each one.
+
+        Returns:
+            int: Total estimated calories
+        """
+        return sum(MealPlan.estimate_calories_from_dict(plan) for plan in self.meals)
 
     def get_weight_progress(self) -> Dict[str, Any]:
         """
@@ -162,6 +196,8 @@ class User:
         Returns:
             Dict[str, Any]: Dictionary containing complete profile summary
         """
+        total_workout_time, workouts_by_category = self._aggregate_workouts()
+
         return {
             "basic_info": {
                 "username": self.username,
@@ -178,8 +214,8 @@ class User:
             },
             "activity_stats": {
                 "total_workouts": len(self.workouts),
-                "total_workout_time": self.get_total_workout_time(),
-                "workouts_by_category": self.get_workouts_by_category(),
+                "total_workout_time": total_workout_time,
+                "workouts_by_category": workouts_by_category,
                 "meal_plans_saved": len(self.meals)
             }
         }
@@ -188,6 +224,9 @@ class User:
         """
         Convert User instance to dictionary for JSON serialization.
 
+        The workout and meal lists are shared with this instance rather than
+        copied, so treat the returned dictionary as read-only.
+
         Returns:
             Dict[str, Any]: Dictionary representation of the user
         """
@@ -198,8 +237,8 @@ class User:
             "weight": self.weight,
             "target_weight": self.target_weight,
             "weekly_workout_goal": self.weekly_workout_goal,
-            "workouts": self.workouts.copy(),
-            "meals": self.meals.copy(),
+            "workouts": self.workouts,
+            "meals": self.meals,
             "created_date": self.created_date,
             "last_login": self.last_login
         }
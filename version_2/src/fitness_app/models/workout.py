@@ -5,10 +5,11 @@ This module contains the Workout class that represents individual workouts
 and workout management functionality.
 """
 
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Dict, List, Optional, Any, Sequence
 from enum import Enum
 
+from ..utils.dates import formatted_today
+
 
 class WorkoutCategory(Enum):
     """Enumeration of available workout categories."""
@@ -24,6 +25,68 @@ class WorkoutIntensity(Enum):
     HIGH = "high"
 
 
+# Base calories per minute for different workout types
+_CALORIE_RATES: Dict[str, int] = {
+    # Cardio workouts
+    "running": 12,
+    "cycling": 10,
+    "swimming": 11,
+    "walking": 5,
+    "dancing": 7,
+    "jumping_jacks": 8,
+
+    # Strength workouts
+    "push_ups": 6,
+    "squats": 7,
+    "deadlifts": 8,
+    "bench_press": 6,
+    "pull_ups": 8,
+    "weight_lifting": 7,
+
+    # Flexibility workouts
+    "yoga": 3,
+    "stretching": 2,
+    "pilates": 4,
+    "tai_chi": 3
+}
+
+# Intensity multipliers applied to the base calorie rate
+_INTENSITY_MULTIPLIERS: Dict[WorkoutIntensity, float] = {
+    WorkoutIntensity.LOW: 0.8,
+    WorkoutIntensity.MEDIUM: 1.0,
+    WorkoutIntensity.HIGH: 1.3
+}
+
+# Category auto-detection for quick workouts; anything else is flexibility
+_QUICK_WORKOUT_CATEGORIES: Dict[str, WorkoutCategory] = {
+    "running": WorkoutCategory.CARDIO,
+    "cycling": WorkoutCategory.CARDIO,
+    "swimming": WorkoutCategory.CARDIO,
+    "walking": WorkoutCategory.CARDIO,
+    "dancing": WorkoutCategory.CARDIO,
+    "push_ups": WorkoutCategory.STRENGTH,
+    "squats": WorkoutCategory.STRENGTH,
+    "deadlifts": WorkoutCategory.STRENGTH,
+    "bench_press": WorkoutCategory.STRENGTH,
+    "pull_ups": WorkoutCategory.STRENGTH
+}
+
+
+def _calories(base_rate: float, duration: int, multiplier: float) -> int:
+    """
+    Core calorie formula (estimate_calories_bulk inlines the same expression).
+
+    Args:
+        base_rate (float): Calories burned per minute at medium intensity
+        duration (int): Duration in minutes
+        multiplier (float): Intensity multiplier
+
+    Returns:
+        int: Estimated calories burned (minimum 1)
+    """
+    return max(int(base_rate * duration * multiplier), 1)
+
+
 class Workout:
     """
     Represents a single workout session.
@@ -41,6 +104,11 @@ class Workout:
         notes (Optional[str]): Additional workout notes
     """
 
+    __slots__ = (
+        "workout_type", "category", "duration", "intensity", "date",
+        "calories_burned", "notes"
+    )
+
     def __init__(
         self,
         workout_type: str,
@@ -67,7 +135,7 @@ class Workout:
         self.category = category
         self.duration = duration
         self.intensity = intensity
-        self.date = date or datetime.now().strftime("%B %d, %Y")
+        self.date = date or formatted_today()
         self.calories_burned = calories_burned or self._estimate_calories()
         self.notes = notes or ""
 
@@ -81,46 +149,34 @@ class Workout:
         Returns:
             int: Estimated calories burned
         """
-        # Base calories per minute for different workout types
-        calorie_rates = {
-            # Cardio workouts
-            "running": 12,
-            "cycling": 10,
-            "swimming": 11,
-            "walking": 5,
-            "dancing": 7,
-            "jumping_jacks": 8,
-
-            # Strength workouts
-            "push_ups": 6,
-            "squats": 7,
-            "deadlifts": 8,
-            "bench_press": 6,
-            "pull_ups": 8,
-            "weight_lifting": 7,
-
-            # Flexibility workouts
-            "yoga": 3,
-            "stretching": 2,
-            "pilates": 4,
-            "tai_chi": 3
-        }
+        base_rate = _CALORIE_RATES.get(self.workout_type, 5)
+        multiplier = _INTENSITY_MULTIPLIERS[self.intensity]
+        return _calories(base_rate, self.duration, multiplier)
+
+    @staticmethod
+    def estimate_calories_bulk(
+        workout_types: Sequence[str],
+        durations: Sequence[int],
+        intensities: Sequence[WorkoutIntensity]
+    ) -> List[int]:
+        """
+        Estimate calories burned for many workouts in one call.
 
-        # Get base rate or default
-        base_rate = calorie_rates.get(self.workout_type, 5)
+        Gives the same results as _estimate_calories without building a
+        Workout per entry, which is useful when re-scoring saved history.
 
-        # Intensity multipliers
-        intensity_multipliers = {
-            WorkoutIntensity.LOW: 0.8,
-            WorkoutIntensity.MEDIUM: 1.0,
-            WorkoutIntensity.HIGH: 1.3
-        }
-
-        # Calculate total calories
-        multiplier = intensity_multipliers[self.intensity]
-        total_calories = int(base_rate * self.duration * multiplier)
+        Args:
+            workout_types (Sequence[str]): Normalized workout types (e.g. "push_ups")
+            durations (Sequence[int]): Durations in minutes
+            intensities (Sequence[WorkoutIntensity]): Intensity levels
 
-        return max(total_calories, 1)  # Minimum 1 calorie
+        Returns:
+            List[int]: Estimated calories burned for each workout
+        """
+        calorie_rates = _CALORIE_RATES
+        multipliers = _INTENSITY_MULTIPLIERS
+        return [max(int(calorie_rates.get(workout_type, 5) * duration * multipliers[intensity]), 1)
+                for workout_type, duration, intensity in zip(workout_types, durations, intensities)]
 
     def update_duration(self, new_duration: int) -> None:
         """
@@ -219,16 +275,8 @@ class Workout:
             Workout: New workout with medium intensity and auto-category
         """
         # Auto-detect category based on workout type
-        cardio_types = ["running", "cycling", "swimming", "walking", "dancing"]
-        strength_types = ["push_ups", "squats",
-                          "deadlifts", "bench_press", "pull_ups"]
-
-        if any(cardio in workout_type.lower() for cardio in cardio_types):
-            category = WorkoutCategory.CARDIO
-        elif any(strength in workout_type.lower() for strength in strength_types):
-            category = WorkoutCategory.STRENGTH
-        else:
-            category = WorkoutCategory.FLEXIBILITY
+        normalized_type = workout_type.lower().replace(" ", "_")
+        category = _QUICK_WORKOUT_CATEGORIES.get(normalized_type, WorkoutCategory.FLEXIBILITY)
 
         return cls(
             workout_type=workout_type,
@@ -245,3 +293,4 @@ class Workout:
         """Developer representation for debugging."""
         return (f"Workout(type='{self.workout_type}', category={self.category.value}, "
                 f"duration={self.duration}, intensity={self.intensity.value})")
+
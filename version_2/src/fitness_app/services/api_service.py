@@ -5,9 +5,50 @@ This module handles external API integrations for workout and nutrition data.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import logging
+import random
+import re
 from typing import Dict, List, Optional, Any, Union
-from time import sleep
+from time import sleep, monotonic
+import threading
+
+try:
+    import requests_cache  # Optional (>= 1.0): on-disk HTTP cache with revalidation
+except ImportError:
+    requests_cache = None
+
+logger = logging.getLogger(__name__)
+
+# Matches any HTML tag, including ones with attributes (e.g. <p class="x">)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Retry policy: 429s are retried by _make_request (honouring Retry-After),
+# transient gateway errors by the session's transport adapter. Connect and
+# read failures are not retried, so an offline user is not kept waiting
+_MAX_RETRIES = 3
+_MAX_RETRY_DELAY_SECONDS = 30.0
+
+# Exercise data rarely changes, so cached responses are kept for a day
+_API_CACHE_PATH = "data/api_cache.sqlite"
+_API_CACHE_EXPIRE_SECONDS = 24 * 60 * 60
+
+# Offline nutrition data used when the food API is unavailable
+_FALLBACK_FOODS: Dict[str, Dict[str, Any]] = {
+    'apple': {'name': 'Apple', 'calories_per_100g': 52, 'protein': 0.3, 'carbs': 14, 'fat': 0.2},
+    'chicken': {'name': 'Chicken Breast', 'calories_per_100g': 165, 'protein': 31, 'carbs': 0, 'fat': 3.6},
+    'rice': {'name': 'White Rice', 'calories_per_100g': 130, 'protein': 2.7, 'carbs': 28, 'fat': 0.3},
+    'banana': {'name': 'Banana', 'calories_per_100g': 89, 'protein': 1.1, 'carbs': 23, 'fat': 0.3},
+    'potatoes': {'name': 'Potatoes', 'calories_per_100g': 77, 'protein': 2, 'carbs': 17, 'fat': 0.1},
+    'salmon': {'name': 'Salmon', 'calories_per_100g': 208, 'protein': 22, 'carbs': 0, 'fat': 12}
+}
+
+# Finds any fallback food keyword in a single scan of the query
+_FALLBACK_FOOD_RE = re.compile('|'.join(map(re.escape, _FALLBACK_FOODS)))
+# Fallback food keyword -> precedence (earlier entries win when several match)
+_FALLBACK_FOOD_ORDER: Dict[str, int] = {key: i for i, key in enumerate(_FALLBACK_FOODS)}
 
 
 class APIError(Exception):
@@ -26,20 +67,88 @@ class WorkoutAPIService:
     def __init__(self) -> None:
         """Initialize the workout API service."""
         self.base_url = "https://wger.de/api/v2"
-        self.session = requests.Session()
+        if requests_cache:
+            self.session = requests_cache.CachedSession(
+                _API_CACHE_PATH,
+                backend='sqlite',
+                expire_after=_API_CACHE_EXPIRE_SECONDS,
+                cache_control=True
+            )
+        else:
+            self.session = requests.Session()
+        retry_adapter = HTTPAdapter(max_retries=Retry(
+            total=None,
+            connect=0,
+            read=0,
+            status=_MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["GET"]
+        ))
+        self.session.mount("https://", retry_adapter)
+        self.session.mount("http://", retry_adapter)
         self.session.headers.update({
             'User-Agent': 'FitnessApp/2.0 (Educational Project)',
             'Accept': 'application/json'
         })
-        self.request_delay = 1  # this is to be respectful to the API
+        # Token bucket rate limiting to be respectful to the API:
+        # on average 1 request per second, with bursts of up to 5
+        self.requests_per_second = 1.0
+        self.rate_limit_burst = 5
+        self._tokens = float(self.rate_limit_burst)
+        self._last_refill = monotonic()
+        self._rate_limit_lock = threading.Lock()
+
+    def _wait_for_rate_limit(self) -> None:
+        """
+        Block until the token bucket allows another request, then consume a token.
+        """
+        with self._rate_limit_lock:
+            now = monotonic()
+            self._tokens = min(self.rate_limit_burst,
+                               self._tokens + (now - self._last_refill) * self.requests_per_second)
+            self._last_refill = now
 
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+            if self._tokens < 1:
+                sleep((1 - self._tokens) / self.requests_per_second)
+                self._tokens = 1.0
+                self._last_refill = monotonic()
+
+            self._tokens -= 1
+
+    def _get_cached_response(self, url: str, params: Optional[Dict]) -> Optional[requests.Response]:
+        """
+        Look up a fresh cached response without contacting the API.
+
+        Args:
+            url (str): Full request URL
+            params (Optional[Dict]): Query parameters
+
+        Returns:
+            Optional[requests.Response]: Cached response, or None on a cache miss
+        """
+        if not requests_cache:
+            return None
+        # requests-cache answers 504 instead of sending the request when nothing
+        # usable is cached
+        try:
+            response = self.session.get(url, params=params, only_if_cached=True)
+        except TypeError:
+            # requests-cache < 1.0 has no only_if_cached; let the normal request
+            # path (which the session still caches) handle it
+            return None
+        return None if response.status_code == 504 else response
+
+    def _make_request(self, endpoint: str, params: Optional[Dict] = None, *,
+                      quiet: bool = False) -> Optional[Dict[str, Any]]:
         """
         Make a request to the API with error handling and rate limiting.
 
         Args:
             endpoint (str): API endpoint to call
             params (Optional[Dict]): Query parameters
+            quiet (bool): Log failures at debug level only, leaving the caller
+                to report the raised APIError. Defaults to False
 
         Returns:
             Optional[Dict]: Response data or None if failed
@@ -48,49 +157,91 @@ class WorkoutAPIService:
             APIError: If request fails after retries
         """
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        log_failure = logger.debug if quiet else logger.warning
 
         try:
-            print(f"🔄 Making API request to: {endpoint}")
-            sleep(self.request_delay)  # Rate limiting
-
-            response = self.session.get(url, params=params, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-                print(f"✅ API request successful!")
-                return data
-            elif response.status_code == 429:
-                print("⚠️ Rate limited, waiting longer...")
-                sleep(5)
-                return self._make_request(endpoint, params)  # Retry once
-            else:
-                print(f"❌ API Error: {response.status_code} - {response.text}")
-                raise APIError(f"API request failed: {response.status_code}")
+            logger.debug("Making API request to: %s", endpoint)
+
+            # Cache hits never reach the API, so they do not spend a rate-limit token
+            cached_response = self._get_cached_response(url, params)
+            if cached_response is not None and cached_response.status_code == 200:
+                logger.debug("Served from cache: %s", endpoint)
+                return cached_response.json()
+
+            for attempt in range(_MAX_RETRIES + 1):
+                self._wait_for_rate_limit()
+
+                response = self.session.get(url, params=params, timeout=10)
+                if response.status_code == 200:
+                    data = response.json()
+                    logger.debug("API request successful: %s", endpoint)
+                    return data
+                elif response.status_code == 429:
+                    if attempt == _MAX_RETRIES:
+                        break
+                    delay = self._get_retry_delay(response, attempt)
+                    log_failure("Rate limited, retrying in %.1fs...", delay)
+                    sleep(delay)
+                else:
+                    log_failure("API Error: %s - %s", response.status_code, response.text)
+                    raise APIError(f"API request failed: {response.status_code}")
+
+            log_failure("Still rate limited after retries")
+            raise APIError("API request failed: 429")
 
         except requests.Timeout:
-            print("❌ Request timed out")
+            log_failure("Request timed out")
             raise APIError("Request timed out")
         except requests.RequestException as e:
-            print(f"❌ Network error: {e}")
+            log_failure("Network error: %s", e)
             raise APIError(f"Network error: {e}")
 
-    def get_exercise_categories(self) -> List[Dict[str, Any]]:
+    def _get_retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """
+        Work out how long to wait before retrying a rate-limited request.
+
+        Uses the Retry-After header when it gives a number of seconds,
+        otherwise exponential backoff with jitter.
+
+        Args:
+            response (requests.Response): The 429 response
+            attempt (int): Zero-based number of the attempt that failed
+
+        Returns:
+            float: Delay in seconds, capped at _MAX_RETRY_DELAY_SECONDS
+        """
+        try:
+            delay = float(response.headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            delay = 2 ** attempt + random.uniform(0, 1)
+        return min(delay, _MAX_RETRY_DELAY_SECONDS)
+
+    def get_exercise_categories(self, quiet: bool = False) -> List[Dict[str, Any]]:
         """
         Fetch available exercise categories from the API.
 
+        Args:
+            quiet (bool): Raise APIError instead of logging it and returning the
+                fallback categories, e.g. for background prefetches. Defaults to False
+
         Returns:
             List[Dict]: List of exercise categories with id and name
+
+        Raises:
+            APIError: If quiet is True and the request fails
         """
         try:
-            data = self._make_request("exercisecategory/")
+            data = self._make_request("exercisecategory/", quiet=quiet)
             if data and 'results' in data:
                 categories = data['results']
-                print(f"📋 Found {len(categories)} exercise categories")
+                logger.debug("Found %d exercise categories", len(categories))
                 return categories
             return []
 
         except APIError as e:
-            print(f"Failed to fetch categories: {e}")
+            if quiet:
+                raise
+            logger.warning("Failed to fetch categories: %s", e)
             return self._get_fallback_categories()
 
     def _get_fallback_categories(self) -> List[Dict[str, Any]]:
@@ -100,7 +251,7 @@ class WorkoutAPIService:
         Returns:
             List[Dict]: Default exercise categories
         """
-        print("🔧 Using fallback exercise categories")
+        logger.info("Using fallback exercise categories")
         return [
             {"id": 1, "name": "Abs"},
             {"id": 2, "name": "Arms"},
@@ -116,6 +267,9 @@ class WorkoutAPIService:
         """
         Fetch exercises for a specific category.
 
+        Uses the exerciseinfo endpoint, which returns full exercise details
+        inline, so a whole category is fetched in a single request.
+
         Args:
             category_id (int): Category ID to fetch exercises for
             limit (int): Maximum number of exercises to return
@@ -130,28 +284,19 @@ class WorkoutAPIService:
                 'language': 2  # English
             }
 
-            data = self._make_request("exercise/", params)
+            data = self._make_request("exerciseinfo/", params)
             if data and 'results' in data:
-                exercises = []
-
-                # Process each exercise
-                for exercise in data['results']:
-                    # Get detailed info for each exercise
-                    exercise_detail = self._make_request(
-                        f"exerciseinfo/{exercise['id']}/")
-                    if exercise_detail:
-                        clean_exercise = self._clean_exercise_data(
-                            exercise_detail)
-                        exercises.append(clean_exercise)
-
-                print(
-                    f"✅ Retrieved {len(exercises)} exercises for category {category_id}")
+                exercises = [self._clean_exercise_data(exercise)
+                             for exercise in data['results']]
+
+                logger.debug("Retrieved %d exercises for category %s",
+                             len(exercises), category_id)
                 return exercises
 
             return []
 
         except APIError as e:
-            print(f"Failed to fetch exercises: {e}")
+            logger.warning("Failed to fetch exercises: %s", e)
             return self._get_fallback_exercises(category_id)
 
     def _clean_exercise_data(self, raw_data: Dict) -> Dict[str, Any]:
@@ -173,8 +318,7 @@ class WorkoutAPIService:
             name = first_translation.get('name', name)
             description = first_translation.get('description', description)
             # Clean HTML tags
-            description = description.replace('<p>', '').replace(
-                '</p>', '').replace('<br>', ' ')
+            description = _HTML_TAG_RE.sub(' ', description).strip()
 
         # Extract category name
         category = "Unknown"
@@ -198,33 +342,24 @@ class WorkoutAPIService:
     def get_food_data(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Search for food/nutrition data."""
         try:
-            print(f"🍎 Searching for food: '{query}'...")
-            sleep(self.request_delay)
+            logger.debug("Searching for food: '%s'", query)
+            self._wait_for_rate_limit()
 
             # For now, use fallback data since Edamam API needs real keys
             return self._get_fallback_foods(query)
 
         except Exception as e:
-            print(f"❌ Food API Error: {e}")
+            logger.warning("Food API Error: %s", e)
             return self._get_fallback_foods(query)
 
     def _get_fallback_foods(self, query: str) -> List[Dict[str, Any]]:
         """Provide fallback food data when API is unavailable."""
-        print("🔧 Using fallback food database")
-
-        fallback_foods = {
-            'apple': {'name': 'Apple', 'calories_per_100g': 52, 'protein': 0.3, 'carbs': 14, 'fat': 0.2},
-            'chicken': {'name': 'Chicken Breast', 'calories_per_100g': 165, 'protein': 31, 'carbs': 0, 'fat': 3.6},
-            'rice': {'name': 'White Rice', 'calories_per_100g': 130, 'protein': 2.7, 'carbs': 28, 'fat': 0.3},
-            'banana': {'name': 'Banana', 'calories_per_100g': 89, 'protein': 1.1, 'carbs': 23, 'fat': 0.3},
-            'potatoes': {'name': 'Potatoes', 'calories_per_100g': 77, 'protein': 2, 'carbs': 17, 'fat': 0.1},
-            'salmon': {'name': 'Salmon', 'calories_per_100g': 208, 'protein': 22, 'carbs': 0, 'fat': 12}
-        }
+        logger.info("Using fallback food database")
 
         # Try to match the query
-        for key, food_data in fallback_foods.items():
-            if key in query.lower():
-                return [food_data]
+        matches = _FALLBACK_FOOD_RE.findall(query.lower())
+        if matches:
+            return [dict(_FALLBACK_FOODS[min(matches, key=_FALLBACK_FOOD_ORDER.__getitem__)])]
 
         # Generic fallback for unknown foods
         return [{'name': f'{query.title()}', 'calories_per_100g': 100, 'protein': 5, 'carbs': 15, 'fat': 2, 'category': 'Generic food'}]
@@ -8,8 +8,24 @@
 from typing import Dict, Optional, Tuple, Any
 from datetime import datetime
 import hashlib
+import hmac
 import json
+import logging
 import os
+from pathlib import Path
+
+try:
+    import orjson  # Optional: much faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# scrypt cost parameters for password hashing (~16 MB, tens of ms per hash)
+_SCRYPT_N = 2 ** 14
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_SALT_BYTES = 16
 
 
 class AuthService:
@@ -23,6 +39,7 @@ class AuthService:
         current_user (Optional[str]): Username of currently logged in user
         session_active (bool): Whether a user session is currently active
         users_file_path (str): Path to the users data file
+        last_login_log_path (str): Path to the append-only last-login log
     """
 
     def __init__(self, users_file_path: str = "data/users.json") -> None:
@@ -35,6 +52,11 @@ class AuthService:
         self.current_user: Optional[str] = None
         self.session_active: bool = False
         self.users_file_path: str = users_file_path
+        self.last_login_log_path: str = os.path.splitext(users_file_path)[0] + "_last_login.log"
+        # Parsed users file, reused while the file's (mtime_ns, size, inode) is unchanged
+        self._users_cache: Optional[Dict[str, Any]] = None
+        self._users_file_key: Tuple[int, int, int] = (0, 0, 0)
+        self._last_login_log_offset: int = 0  # Bytes of the log already applied
         self._ensure_users_file_exists()
 
     def _ensure_users_file_exists(self) -> None:
@@ -49,20 +71,24 @@ class AuthService:
             os.makedirs(os.path.dirname(self.users_file_path), exist_ok=True)
 
             # Create empty users file
-            with open(self.users_file_path, 'w') as file:
-                json.dump({}, file, indent=2)
+            Path(self.users_file_path).write_bytes(b"{}")
 
-    def _hash_password(self, password: str) -> str:
+    def _hash_password(self, password: str, salt: Optional[bytes] = None) -> str:
         """
-        Hash a password using SHA-256 for secure storage.
+        Hash a password using salted scrypt for secure storage.
 
         Args:
             password (str): Plain text password to hash
+            salt (Optional[bytes]): Salt to use. Defaults to a new random salt
 
         Returns:
-            str: Hashed password as hexadecimal string
+            str: Salt and derived key as "salt_hex$key_hex"
         """
-        return hashlib.sha256(password.encode()).hexdigest()
+        if salt is None:
+            salt = os.urandom(_SALT_BYTES)
+        derived_key = hashlib.scrypt(password.encode(), salt=salt,
+                                     n=_SCRYPT_N, r=_SCRYPT_R, p=_SCRYPT_P)
+        return f"{salt.hex()}${derived_key.hex()}"
 
     def _verify_password(self, password: str, hashed_password: str) -> bool:
         """
@@ -75,12 +101,24 @@ class AuthService:
         Returns:
             bool: True if password matches, False otherwise
         """
-        return self._hash_password(password) == hashed_password
+        if "$" not in hashed_password:
+            # Legacy unsalted SHA-256 hash from accounts created before scrypt
+            legacy_hash = hashlib.sha256(password.encode()).hexdigest()
+            return hmac.compare_digest(legacy_hash, hashed_password)
+
+        # Rederive with the stored salt: a single scrypt evaluation per attempt
+        salt_hex = hashed_password.split("$", 1)[0]
+        return hmac.compare_digest(
+            self._hash_password(password, bytes.fromhex(salt_hex)), hashed_password)
 
     def _load_users(self) -> Dict[str, Any]:
         """
         Load user data from the JSON file.
 
+        The parsed data is cached and only re-read when the file has been
+        modified since the last load or save. Last-login records appended to
+        the sidecar log since the previous load are applied on top.
+
         Returns:
             Dict[str, Any]: Dictionary containing all user data
 
@@ -89,18 +127,77 @@ class AuthService:
             json.JSONDecodeError: If users file contains invalid JSON
         """
         try:
-            with open(self.users_file_path, 'r') as file:
-                return json.load(file)
+            file_key = self._stat_users_file()
+            if self._users_cache is None or file_key != self._users_file_key:
+                raw_data = Path(self.users_file_path).read_bytes()
+                self._users_cache = orjson.loads(raw_data) if orjson else json.loads(raw_data)
+                self._users_file_key = file_key
+                self._last_login_log_offset = 0
+
+            self._apply_last_login_log(self._users_cache)
+            return self._users_cache
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Users file not found: {self.users_file_path}")
         except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(f"Invalid JSON in users file: {e}")
+            raise json.JSONDecodeError(f"Invalid JSON in users file: {e.msg}", e.doc, e.pos)
+
+    def _stat_users_file(self) -> Tuple[int, int, int]:
+        """
+        Identify the current version of the users file for cache validation.
+
+        Size and inode catch rewrites that land within the filesystem's
+        timestamp granularity, including replacement by os.replace.
+
+        Returns:
+            Tuple[int, int, int]: (mtime in nanoseconds, size in bytes, inode)
+        """
+        stat_result = os.stat(self.users_file_path)
+        return stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino
+
+    def _apply_last_login_log(self, users_data: Dict[str, Any]) -> None:
+        """
+        Apply last-login records appended to the sidecar log since the last read.
+
+        Malformed records (e.g. left behind by a crash mid-append) are skipped
+        with a warning so that one bad line cannot block every login.
+
+        Args:
+            users_data (Dict[str, Any]): Loaded user data to update in place
+        """
+        try:
+            with open(self.last_login_log_path, 'rb') as file:
+                file.seek(self._last_login_log_offset)
+                new_records = file.read()
+        except FileNotFoundError:
+            return
+
+        # Only consume complete lines. An unterminated tail is either still being
+        # written or was cut short by a crash; in the latter case the next
+        # update_last_login terminates it and it is skipped below as malformed.
+        complete_length = new_records.rfind(b"\n") + 1
+        for line in new_records[:complete_length].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            if not (isinstance(record, list) and len(record) == 2
+                    and all(isinstance(value, str) for value in record)):
+                logger.warning("Skipping malformed last-login record: %r", line)
+                continue
+
+            username, last_login = record
+            if username in users_data:
+                users_data[username]["last_login"] = last_login
+        self._last_login_log_offset += complete_length
 
     def _save_users(self, users_data: Dict[str, Any]) -> None:
         """
         Save user data to the JSON file.
 
+        The data is written to a temporary file which then atomically replaces
+        the users file, so a crash mid-write never leaves a truncated file.
+
         Args:
             users_data (Dict[str, Any]): User data dictionary to save
 
@@ -108,9 +205,24 @@ class AuthService:
             IOError: If file cannot be written
         """
         try:
-            with open(self.users_file_path, 'w') as file:
-                json.dump(users_data, file, indent=2)
+            if orjson:
+                encoded = orjson.dumps(users_data, option=orjson.OPT_INDENT_2)
+            else:
+                encoded = json.dumps(users_data, indent=2).encode()
+
+            temp_path = self.users_file_path + ".tmp"
+            Path(temp_path).write_bytes(encoded)
+            os.replace(temp_path, self.users_file_path)
+
+            self._users_cache = users_data
+            self._users_file_key = self._stat_users_file()
+
+            # The full file now includes every logged last login, so compact the log
+            if os.path.exists(self.last_login_log_path):
+                open(self.last_login_log_path, 'wb').close()
+            self._last_login_log_offset = 0
         except IOError as e:
+            self._users_cache = None  # May no longer match what is on disk
             raise IOError(f"Cannot write to users file: {e}")
 
     def login(self, username: str, password: str) -> Tuple[bool, str]:
@@ -138,6 +250,16 @@ class AuthService:
             if not self._verify_password(password, stored_hash):
                 return False, "Invalid password"
 
+            # Upgrade legacy unsalted hashes now that the plaintext is known
+            if "$" not in stored_hash:
+                users_data[username]["password_hash"] = self._hash_password(password)
+                try:
+                    self._save_users(users_data)
+                except OSError as e:
+                    # Non-critical: the legacy hash still verifies next time
+                    users_data[username]["password_hash"] = stored_hash
+                    logger.warning("Could not upgrade password hash: %s", e)
+
             # Start session
             self.current_user = username
             self.session_active = True
@@ -188,6 +310,8 @@ class AuthService:
                 "target_weight": target_weight,
                 "weekly_workout_goal": weekly_workout_goal,
                 "workouts": [],
+                "total_workout_minutes": 0,
+                "last_workout": None,
                 "meals": [],
                 "created_date": datetime.now().strftime("%B %d, %Y"),
                 "last_login": datetime.now().strftime("%B %d, %Y at %I:%M %p")
@@ -246,12 +370,19 @@ class AuthService:
         """
         Get user data for specified user or current user.
 
+        Served from the users cache kept by _load_users: the users file is only
+        re-parsed when it changes on disk, but every call still stats it and
+        reads any new records from the last-login log.
+
+        The returned dictionary is the live cached entry, not a copy, so
+        changes made to it are visible to every later caller.
+
         Args:
             username (Optional[str]): Username to get data for. 
                                     Defaults to current user if None
 
         Returns:
-            Optional[Dict[str, Any]]: User data dictionary or None if user not found
+            Optional[Dict[str, Any]]: Shared user data dictionary or None if user not found
         """
         try:
             users_data = self._load_users()
@@ -262,19 +393,30 @@ class AuthService:
             return None
 
         except Exception:
+            logger.warning("Could not load user data", exc_info=True)
             return None
 
     def update_last_login(self) -> None:
         """
         Update the last login timestamp for the current user.
+
+        Appends a record to the last-login log instead of rewriting the whole
+        users file; the record is folded into the users file on the next save.
         """
         if not self.session_active or self.current_user is None:
             return
 
         try:
-            users_data = self._load_users()
-            users_data[self.current_user]["last_login"] = datetime.now().strftime(
-                "%B %d, %Y at %I:%M %p")
-            self._save_users(users_data)
-        except Exception:
-            pass  # Silently fail for non-critical operation
+            last_login = datetime.now().strftime("%B %d, %Y at %I:%M %p")
+            record = json.dumps([self.current_user, last_login]) + "\n"
+            with open(self.last_login_log_path, 'a+b') as file:
+                # Never extend a record left unterminated by a crash mid-append
+                size = file.seek(0, os.SEEK_END)
+                if size:
+                    file.seek(size - 1)
+                    if file.read(1) != b"\n":
+                        record = "\n" + record
+                file.write(record.encode())
+        except OSError as e:
+            # Non-critical: the login itself already succeeded
+            logger.warning("Could not record last login: %s", e)
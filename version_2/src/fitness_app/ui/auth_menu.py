@@ -7,30 +7,44 @@ import sys
 from ..services.auth_service import AuthService
 from ..utils.validators import UserValidator, MenuValidator
 
+# Accepted answers for yes prompts
+_YES = frozenset(('y', 'yes'))
+
+# Authentication menu text, printed with a single write per redraw
+_AUTH_MENU = (
+    "\n=== Authentication Menu ===\n"
+    "1. Login\n"
+    "2. Create Account\n"
+    "3. Exit"
+)
+
 
 class AuthMenu:
     """Authentication menu handler."""
 
+    __slots__ = ("auth_service", "_dispatch")
+
     def __init__(self) -> None:
         """Initialize auth menu."""
         self.auth_service = AuthService()
+        # Menu choice -> handler; "3" (exit) is handled by the menu loop
+        self._dispatch = {
+            "1": self.handle_login,
+            "2": self.handle_signup
+        }
 
     def show_auth_menu(self) -> Optional[str]:
         """Show authentication menu."""
         print("\n🏋️ WELCOME TO FITNESS WORLD v2.0! 🏋️")
 
         while True:
-            print("\n=== Authentication Menu ===")
-            print("1. Login")
-            print("2. Create Account")
-            print("3. Exit")
+            print(_AUTH_MENU)
 
             choice = input("Choose (1-3): ")
 
-            if choice == "1":
-                return self.handle_login()
-            elif choice == "2":
-                return self.handle_signup()
+            handler = self._dispatch.get(choice)
+            if handler is not None:
+                return handler()
             elif choice == "3":
                 print("Goodbye!")
                 sys.exit(0)
@@ -67,7 +81,7 @@ class AuthMenu:
                 if "Username not found" in message:
                     create = input(
                         "Would you like to create an account? (y/n): ")
-                    if create.lower() in ['y', 'yes']:
+                    if create.strip().lower() in _YES:
                         return self.handle_signup()
 
                 return None
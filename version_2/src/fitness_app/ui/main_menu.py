@@ -2,61 +2,188 @@
 Main application menu for Fitness App v2.0
 """
 
-from typing import Optional
-from ..services.api_service import WorkoutAPIService
+import atexit
+import random
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+from ..services.api_service import APIError, WorkoutAPIService
 from ..services.auth_service import AuthService
+from ..utils.dates import formatted_today
 from ..utils.validators import MenuValidator
 
+# Accepted answers for yes prompts and workout intensity
+_YES = frozenset(('y', 'yes'))
+_INTENSITIES = frozenset(('low', 'medium', 'high'))
+
+# Longest workout that can be logged, in minutes
+_MAX_WORKOUT_MINUTES = 24 * 60
+
+# Simple meal suggestions based on goals, as (display label, options) pairs
+_MEAL_SUGGESTIONS = (
+    ("Breakfast", ('Oatmeal with fruit', 'Eggs with toast', 'Greek yogurt', 'Smoothie bowl')),
+    ("Lunch", ('Chicken salad', 'Rice bowl', 'Sandwich', 'Soup and bread')),
+    ("Dinner", ('Grilled salmon', 'Chicken stir-fry', 'Pasta with vegetables', 'Lean beef')),
+    ("Snacks", ('Apple with nuts', 'Protein bar', 'Greek yogurt', 'Banana'))
+)
+
+# Main menu text, printed with a single write per redraw
+_MAIN_MENU = (
+    "\n=== Main Menu ===\n"
+    "1. 💪 Browse Exercise Categories (Live API)\n"
+    "2. 🍎 Search Nutrition Data (Live API)\n"
+    "3. 📝 Log Custom Workout\n"
+    "4. 🍽️ Plan Meals\n"
+    "5. 📊 View Progress\n"
+    "6. ⚙️ Update Profile\n"
+    "7. 🚪 Logout"
+)
+
 
 class MainMenu:
     """Handles the main application menu and features."""
 
+    __slots__ = (
+        "current_user", "auth_service", "api_service", "_users_cache", "_dirty",
+        "_categories_future", "_dispatch"
+    )
+
     def __init__(self, current_user: str):
         """Initialize main menu for logged in user."""
         self.current_user = current_user
         self.auth_service = AuthService()
         self.api_service = WorkoutAPIService()  # 🔥 LIVE API DATA!
+        # All users' data, loaded once per session and written through on save
+        self._users_cache: Dict[str, Any] = self.auth_service._load_users()
+        self._backfill_workout_totals()
+        # Changes are batched and written once at logout or interpreter exit
+        self._dirty = False
+        atexit.register(self._flush)
+        # Exercise categories are fetched once in the background while the
+        # user reads the menu, so the first browse rarely waits on the API
+        self._categories_future: Optional[Future] = None
+        # Menu choice -> handler; 7 (logout) is handled by the menu loop
+        self._dispatch = {
+            1: self.browse_exercises,
+            2: self.search_nutrition,
+            3: self.log_custom_workout,
+            4: self.plan_meals,
+            5: self.view_progress,
+            6: self.update_profile
+        }
+
+    def _get_users(self, refresh: bool = False) -> Dict[str, Any]:
+        """Return the cached users data, reloading it from disk if refresh is True."""
+        if refresh:
+            self._flush()
+            self._users_cache = self.auth_service._load_users()
+            self._backfill_workout_totals()
+        return self._users_cache
+
+    def _backfill_workout_totals(self) -> None:
+        """Compute the stored workout totals for profiles saved before they existed."""
+        user_data = self._users_cache.get(self.current_user)
+        if user_data is None or "total_workout_minutes" in user_data:
+            return
+        workouts = user_data.get("workouts", [])
+        user_data["total_workout_minutes"] = sum(w.get("duration", 0) for w in workouts)
+        user_data["last_workout"] = workouts[-1] if workouts else None
+
+    @staticmethod
+    def _make_workout_entry(workout_type: str, category: str, duration: int,
+                            intensity: str) -> Dict[str, Any]:
+        """Build a workout history entry dated today."""
+        return {
+            "type": workout_type,
+            "category": category,
+            "duration": duration,
+            "intensity": intensity,
+            "date": formatted_today()
+        }
+
+    @staticmethod
+    def _append_workout(user_data: Dict[str, Any], workout_entry: Dict[str, Any]) -> None:
+        """Add a workout to a profile and keep its running totals up to date."""
+        user_data["workouts"].append(workout_entry)
+        user_data["total_workout_minutes"] = (
+            user_data.get("total_workout_minutes", 0) + workout_entry["duration"])
+        user_data["last_workout"] = workout_entry
+
+    def _flush(self) -> None:
+        """
+        Write the current user's unsaved changes to disk.
+
+        The users file is re-loaded first and only this user's entry is
+        replaced, so accounts and records written by other sessions since
+        login are kept.
+        """
+        if not self._dirty:
+            return
+        try:
+            users_data = self.auth_service._load_users()
+            users_data[self.current_user] = self._users_cache[self.current_user]
+            self.auth_service._save_users(users_data)
+            self._users_cache = users_data
+            self._dirty = False
+        except (IOError, ValueError) as e:
+            print(f"❌ Could not save your data: {e}")
+
+    def _start_categories_prefetch(self) -> None:
+        """
+        Fetch exercise categories on a background thread.
+
+        The thread is a daemon so an unreachable API never delays exit, and it
+        reports failures through its result instead of printing over the prompt.
+        """
+        future: Future = Future()
+
+        def prefetch() -> None:
+            try:
+                future.set_result((self.api_service.get_exercise_categories(quiet=True), None))
+            except APIError as e:
+                future.set_result(([], e))
+            except Exception as e:
+                future.set_exception(e)
+
+        self._categories_future = future
+        threading.Thread(target=prefetch, daemon=True).start()
+
+    def _get_categories(self) -> List[Dict[str, Any]]:
+        """Return the prefetched exercise categories once, then fetch directly."""
+        future, self._categories_future = self._categories_future, None
+        if future is None:
+            return self.api_service.get_exercise_categories()
+
+        categories, error = future.result()
+        if error is not None:
+            print(f"⚠️ {error} - showing offline exercise categories")
+            return self.api_service._get_fallback_categories()
+        return categories
 
     def show_main_menu(self) -> None:
         """Display main menu with all app features."""
-        user_data = self.auth_service.get_user_data(self.current_user)
+        user_data = self._get_users().get(self.current_user)
         user_name = user_data['name'] if user_data else self.current_user
 
         print(f"\n🏋️ Welcome to Fitness World, {user_name}! 🏋️")
         print("="*60)
 
+        self._start_categories_prefetch()
+
         while True:
-            print(f"\n=== Main Menu ===")
-            print("1. 💪 Browse Exercise Categories (Live API)")
-            print("2. 🍎 Search Nutrition Data (Live API)")
-            print("3. 📝 Log Custom Workout")
-            print("4. 🍽️ Plan Meals")
-            print("5. 📊 View Progress")
-            print("6. ⚙️ Update Profile")
-            print("7. 🚪 Logout")
+            print(_MAIN_MENU)
 
             try:
                 choice = input("\nChoose an option (1-7): ")
                 validated_choice = MenuValidator.validate_menu_choice(
                     choice, 1, 7)
 
-                if validated_choice == 1:
-                    self.browse_exercises()
-                elif validated_choice == 2:
-                    self.search_nutrition()
-                elif validated_choice == 3:
-                    self.log_custom_workout()
-                elif validated_choice == 4:
-                    self.plan_meals()
-                elif validated_choice == 5:
-                    self.view_progress()
-                elif validated_choice == 6:
-                    self.update_profile()
-                elif validated_choice == 7:
+                if validated_choice == 7:
+                    self._flush()
                     print(f"👋 Goodbye {user_name}!")
                     break
-                else:
-                    print("🚧 Feature coming soon!")
+
+                self._dispatch[validated_choice]()
 
             except ValueError as e:
                 print(f"❌ {e}")
@@ -68,7 +195,7 @@ class MainMenu:
 
         # Get categories from API
         print("🔄 Loading exercise categories...")
-        categories = self.api_service.get_exercise_categories()
+        categories = self._get_categories()
 
         if not categories:
             print("❌ Unable to load exercises. Please try again later.")
@@ -79,19 +206,15 @@ class MainMenu:
         for i, category in enumerate(categories, 1):
             print(f"  {i}. {category['name']}")
 
-        try:
-            # Let user choose category
-            choice = input(f"\nChoose a category (1-{len(categories)}): ")
-            category_index = int(choice) - 1
-
-            if 0 <= category_index < len(categories):
-                selected_category = categories[category_index]
-                self.show_exercises_in_category(selected_category)
-            else:
-                print("❌ Invalid category selection")
+        # Let user choose category
+        choice = input(f"\nChoose a category (1-{len(categories)}): ")
+        category_number = MenuValidator.try_parse_int(choice, 1, len(categories))
 
-        except ValueError:
-            print("❌ Please enter a valid number")
+        if category_number is not None:
+            selected_category = categories[category_number - 1]
+            self.show_exercises_in_category(selected_category)
+        else:
+            print("❌ Invalid category selection")
 
     def show_exercises_in_category(self, category: dict) -> None:
         """Show exercises for a specific category."""
@@ -104,18 +227,20 @@ class MainMenu:
             category['id'], limit=5)
 
         if exercises:
-            print(f"\n✅ Found {len(exercises)} exercises:")
+            # Build the whole list first so it is written in one go
+            lines = [f"\n✅ Found {len(exercises)} exercises:"]
             for i, exercise in enumerate(exercises, 1):
-                print(f"\n{i}. {exercise['name']}")
-                print(f"   Category: {exercise['category']}")
+                lines.append(f"\n{i}. {exercise['name']}")
+                lines.append(f"   Category: {exercise['category']}")
                 if exercise['equipment']:
-                    print(f"   Equipment: {', '.join(exercise['equipment'])}")
-                print(f"   Description: {exercise['description'][:100]}...")
+                    lines.append(f"   Equipment: {', '.join(exercise['equipment'])}")
+                lines.append(f"   Description: {exercise['description'][:100]}...")
+            print("\n".join(lines))
 
             # Ask if they want to log a workout
             log_choice = input(
                 "\nWould you like to log one of these exercises? (y/n): ")
-            if log_choice.lower() in ['y', 'yes']:
+            if log_choice.strip().lower() in _YES:
                 self.log_exercise_workout(exercises)
         else:
             print(f"❌ No exercises found for {category['name']}")
@@ -131,40 +256,38 @@ class MainMenu:
                 print("❌ Workout name required")
                 return
 
-            duration = int(input("Duration (minutes): "))
-            intensity = input("Intensity (low/medium/high): ").lower()
+            duration = MenuValidator.try_parse_int(
+                input("Duration (minutes): "), 1, _MAX_WORKOUT_MINUTES)
+            if duration is None:
+                print("❌ Please enter valid numbers for duration")
+                return
+
+            intensity = input("Intensity (low/medium/high): ").strip().lower()
 
-            if intensity not in ['low', 'medium', 'high']:
+            if intensity not in _INTENSITIES:
                 intensity = 'medium'
                 print("⚠️ Invalid intensity, defaulting to medium")
 
-            # Create workout entry
-            from datetime import datetime
-            workout_entry = {
-                "type": workout_name,
-                "category": "custom",
-                "duration": duration,
-                "intensity": intensity,
-                "date": datetime.now().strftime("%B %d, %Y")
-            }
+            workout_entry = self._make_workout_entry(
+                workout_name, "custom", duration, intensity)
 
             try:
                 # Load current user data
-                users_data = self.auth_service._load_users()
+                users_data = self._get_users()
 
                 # Add workout to user's history
                 if self.current_user in users_data:
-                    users_data[self.current_user]["workouts"].append(
-                        workout_entry)
+                    self._append_workout(
+                        users_data[self.current_user], workout_entry)
 
-                    # Save back to file
-                    self.auth_service._save_users(users_data)
+                    # Saved to file at logout
+                    self._dirty = True
 
-                    print(f"\n✅ Custom workout saved!")
+                    print(f"\n✅ Custom workout logged!")
                     print(f"   Name: {workout_name.title()}")
                     print(f"   Duration: {duration} minutes")
                     print(f"   Intensity: {intensity.title()}")
-                    print("💾 Successfully saved to your profile!")
+                    print("💾 It will be saved to your profile when you log out.")
                 else:
                     print("❌ Could not find user profile")
 
@@ -172,8 +295,6 @@ class MainMenu:
                 print(f"❌ Error saving workout: {e}")
                 print("💡 Workout logged but not saved to profile")
 
-        except ValueError:
-            print("❌ Please enter valid numbers for duration")
         except Exception as e:
             print(f"❌ Error logging workout: {e}")
 
@@ -183,9 +304,9 @@ class MainMenu:
         print("="*50)
 
         try:
-            food_query = input("What food would you like to search for? ")
+            food_query = input("What food would you like to search for? ").strip()
 
-            if food_query.strip():
+            if food_query:
                 print("🔄 Searching nutrition database...")
                 foods = self.api_service.get_food_data(food_query, limit=3)
 
@@ -207,77 +328,45 @@ class MainMenu:
             print(f"❌ Error searching for food: {e}")
             print("💡 Please try again with a different food item")
 
-    def log_custom_workout(self) -> None:
-        """Log a custom workout without API data."""
-        print("\n📝 Log Custom Workout")
-        print("="*40)
-
-        try:
-            # Get workout details
-            workout_name = input("Workout name: ").strip()
-            if not workout_name:
-                print("❌ Workout name required")
-                return
-
-            duration = int(input("Duration (minutes): "))
-            intensity = input("Intensity (low/medium/high): ").lower()
-
-            if intensity not in ['low', 'medium', 'high']:
-                intensity = 'medium'
-                print("⚠️ Invalid intensity, defaulting to medium")
-
-            # Simple success message (we'll save to user data later)
-            print(f"\n✅ Custom workout logged!")
-            print(f"   Name: {workout_name.title()}")
-            print(f"   Duration: {duration} minutes")
-            print(f"   Intensity: {intensity.title()}")
-            print("💾 Saved to your workout history!")
-
-        except ValueError:
-            print("❌ Please enter valid numbers for duration")
-        except Exception as e:
-            print(f"❌ Error logging workout: {e}")
-
     def log_exercise_workout(self, exercises: list) -> None:
         """Log a workout with a selected exercise from API."""
         try:
             choice = input(f"Choose exercise (1-{len(exercises)}): ")
-            exercise_index = int(choice) - 1
+            exercise_number = MenuValidator.try_parse_int(choice, 1, len(exercises))
 
-            if 0 <= exercise_index < len(exercises):
-                selected_exercise = exercises[exercise_index]
+            if exercise_number is not None:
+                selected_exercise = exercises[exercise_number - 1]
 
                 # Get workout details
-                duration = int(input("Duration (minutes): "))
-                intensity = input("Intensity (low/medium/high): ").lower()
+                duration = MenuValidator.try_parse_int(
+                    input("Duration (minutes): "), 1, _MAX_WORKOUT_MINUTES)
+                if duration is None:
+                    print("❌ Please enter valid numbers")
+                    return
+
+                intensity = input("Intensity (low/medium/high): ").strip().lower()
 
-                if intensity not in ['low', 'medium', 'high']:
+                if intensity not in _INTENSITIES:
                     intensity = 'medium'
                     print("⚠️ Invalid intensity, defaulting to medium")
 
-                # Create workout entry
-                from datetime import datetime
-                workout_entry = {
-                    "type": selected_exercise['name'],
-                    "category": selected_exercise['category'],
-                    "duration": duration,
-                    "intensity": intensity,
-                    "date": datetime.now().strftime("%B %d, %Y")
-                }
+                workout_entry = self._make_workout_entry(
+                    selected_exercise['name'], selected_exercise['category'],
+                    duration, intensity)
 
                 # Save to user data
                 try:
-                    users_data = self.auth_service._load_users()
+                    users_data = self._get_users()
                     if self.current_user in users_data:
-                        users_data[self.current_user]["workouts"].append(
-                            workout_entry)
-                        self.auth_service._save_users(users_data)
+                        self._append_workout(
+                            users_data[self.current_user], workout_entry)
+                        self._dirty = True
 
                         print(f"\n✅ API workout logged!")
                         print(f"   Exercise: {selected_exercise['name']}")
                         print(f"   Duration: {duration} minutes")
                         print(f"   Intensity: {intensity}")
-                        print("💾 Successfully saved to your profile!")
+                        print("💾 It will be saved to your profile when you log out.")
                     else:
                         print("❌ Could not save to profile")
                 except Exception as e:
@@ -286,8 +375,6 @@ class MainMenu:
             else:
                 print("❌ Invalid exercise selection")
 
-        except ValueError:
-            print("❌ Please enter valid numbers")
         except Exception as e:
             print(f"❌ Error: {e}")
 
@@ -297,36 +384,37 @@ class MainMenu:
         print("="*50)
 
         # Get user data
-        user_data = self.auth_service.get_user_data(self.current_user)
+        user_data = self._get_users().get(self.current_user)
 
         if user_data:
-            print(f"\n👤 Profile: {user_data['name']}")
-            print(
-                f"📅 Member since: {user_data.get('created_date', 'Unknown')}")
-            print(
-                f"🎯 Target weight: {user_data.get('target_weight', user_data['weight'])}kg")
-            print(f"⚖️ Current weight: {user_data['weight']}kg")
-            print(
-                f"🏃 Weekly goal: {user_data.get('weekly_workout_goal', 3)} workouts")
+            # Build the whole report first so it is written in one go
+            lines = [
+                f"\n👤 Profile: {user_data['name']}",
+                f"📅 Member since: {user_data.get('created_date', 'Unknown')}",
+                f"🎯 Target weight: {user_data.get('target_weight', user_data['weight'])}kg",
+                f"⚖️ Current weight: {user_data['weight']}kg",
+                f"🏃 Weekly goal: {user_data.get('weekly_workout_goal', 3)} workouts"
+            ]
 
             # Workout stats
             workouts = user_data.get('workouts', [])
             meals = user_data.get('meals', [])
 
-            print(f"\n💪 Workout Stats:")
-            print(f"   Total workouts logged: {len(workouts)}")
-            print(f"   Meal plans saved: {len(meals)}")
+            lines.append(f"\n💪 Workout Stats:")
+            lines.append(f"   Total workouts logged: {len(workouts)}")
+            lines.append(f"   Meal plans saved: {len(meals)}")
 
             if workouts:
-                total_time = sum(w.get('duration', 0) for w in workouts)
-                print(f"   Total workout time: {total_time} minutes")
+                total_time = user_data.get('total_workout_minutes', 0)
+                lines.append(f"   Total workout time: {total_time} minutes")
 
                 # Recent workout
-                recent = workouts[-1]
-                print(
+                recent = user_data.get('last_workout') or {}
+                lines.append(
                     f"   Last workout: {recent.get('type', 'Unknown')} - {recent.get('date', 'Unknown')}")
 
-            print(f"\n🎉 Keep up the fantastic work!")
+            lines.append(f"\n🎉 Keep up the fantastic work!")
+            print("\n".join(lines))
         else:
             print("❌ Could not load user data")
 
@@ -335,22 +423,14 @@ class MainMenu:
         print("\n🍽️ Meal Planning")
         print("="*40)
 
-        # Simple meal suggestions based on goals
-        meal_options = {
-            'breakfast': ['Oatmeal with fruit', 'Eggs with toast', 'Greek yogurt', 'Smoothie bowl'],
-            'lunch': ['Chicken salad', 'Rice bowl', 'Sandwich', 'Soup and bread'],
-            'dinner': ['Grilled salmon', 'Chicken stir-fry', 'Pasta with vegetables', 'Lean beef'],
-            'snacks': ['Apple with nuts', 'Protein bar', 'Greek yogurt', 'Banana']
-        }
-
-        print("🍎 Today's meal suggestions:")
-        for meal_type, options in meal_options.items():
-            import random
-            suggestion = random.choice(options)
-            print(f"   {meal_type.title()}: {suggestion}")
+        choice = random.choice
+        lines = ["🍎 Today's meal suggestions:"]
+        lines.extend(f"   {label}: {choice(options)}"
+                     for label, options in _MEAL_SUGGESTIONS)
+        print("\n".join(lines))
 
-        save = input("\nSave this meal plan? (y/n): ").lower()
-        if save in ['y', 'yes']:
+        save = input("\nSave this meal plan? (y/n): ").strip().lower()
+        if save in _YES:
             print("✅ Meal plan saved!")
             # TODO:
         else:
@@ -362,7 +442,7 @@ class MainMenu:
         print("="*40)
 
         try:
-            users_data = self.auth_service._load_users()
+            users_data = self._get_users()
             user_data = users_data[self.current_user]
 
             print(f"Current profile:")
@@ -402,8 +482,8 @@ class MainMenu:
                 print("Update cancelled")
                 return
 
-            self.auth_service._save_users(users_data)
-            print("💾 Profile updated successfully!")
+            self._dirty = True
+            print("✅ Profile updated! Changes are saved when you log out.")
 
         except Exception as e:
             print(f"❌ Error updating profile: {e}")
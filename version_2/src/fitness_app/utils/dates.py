@@ -0,0 +1,60 @@
+"""
+Date formatting utilities for Fitness App v2.0
+
+This module provides cached "current time" strings so that bulk object
+creation does not repeat the same strftime work.
+"""
+
+from typing import Dict, Tuple
+from datetime import date, datetime
+from time import time
+
+# Format string -> (epoch second it was rendered in, rendered string)
+_now_cache: Dict[str, Tuple[int, str]] = {}
+
+# Format string -> (day it was rendered on, rendered string)
+_today_cache: Dict[str, Tuple[date, str]] = {}
+
+
+def formatted_now(fmt: str) -> str:
+    """
+    Get the current local time formatted with the given strftime format.
+
+    Results are reused for the rest of the current second.
+
+    Args:
+        fmt (str): strftime format string (e.g. "%B %d, %Y")
+
+    Returns:
+        str: Current time rendered with the format
+    """
+    second = int(time())
+    cached = _now_cache.get(fmt)
+    if cached is not None and cached[0] == second:
+        return cached[1]
+
+    formatted = datetime.now().strftime(fmt)
+    _now_cache[fmt] = (second, formatted)
+    return formatted
+
+
+def formatted_today(fmt: str = "%B %d, %Y") -> str:
+    """
+    Get today's date formatted with the given date-only strftime format.
+
+    Results are reused until the local date changes.
+
+    Args:
+        fmt (str): strftime format without time fields. Defaults to "%B %d, %Y"
+
+    Returns:
+        str: Today's date rendered with the format
+    """
+    today = date.today()
+    cached = _today_cache.get(fmt)
+    if cached is not None and cached[0] == today:
+        return cached[1]
+
+    formatted = today.strftime(fmt)
+    _today_cache[fmt] = (today, formatted)
+    return formatted
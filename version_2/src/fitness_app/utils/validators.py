@@ -5,7 +5,26 @@ This module contains validation classes for user input validation
 across the application.
 """
 
-from typing import Tuple
+import re
+from typing import Final, Optional, Tuple
+
+# Accepted yes/no responses (already stripped and lowercased)
+_YES = frozenset(('y', 'yes', 'true', '1'))
+_NO = frozenset(('n', 'no', 'false', '0'))
+
+# Allowed ranges for user profile fields (inclusive unless noted)
+_MIN_USERNAME_LENGTH: Final[int] = 3
+_MAX_USERNAME_LENGTH: Final[int] = 20
+_MIN_NAME_LENGTH: Final[int] = 2
+_MAX_NAME_LENGTH: Final[int] = 50
+_MIN_AGE: Final[int] = 13
+_MAX_AGE: Final[int] = 100
+_MIN_WEIGHT_KG: Final[int] = 2  # Exclusive
+_MAX_WEIGHT_KG: Final[int] = 1000
+
+# A valid username in one pass; [^\W_] matches exactly what str.isalnum() accepts
+_USERNAME_RE = re.compile(
+    rf'[^\W_]{{{_MIN_USERNAME_LENGTH},{_MAX_USERNAME_LENGTH}}}')
 
 
 class MenuValidator:
@@ -32,20 +51,38 @@ class MenuValidator:
         Raises:
             ValueError: If choice is invalid or out of range
         """
-        if not isinstance(choice, str):
-            raise ValueError("Choice must be a string")
-
+        # int() and float() already ignore surrounding whitespace
         try:
-            choice_int = int(choice.strip())
+            choice_int = int(choice)
         except ValueError:
             raise ValueError("Please enter a valid number")
 
-        if choice_int < min_choice or choice_int > max_choice:
+        if not min_choice <= choice_int <= max_choice:
             raise ValueError(
                 f"Please choose a number between {min_choice}-{max_choice}")
 
         return choice_int
 
+    @staticmethod
+    def try_parse_int(value: str, min_value: int, max_value: int) -> Optional[int]:
+        """
+        Parse a whole number within a range, returning None instead of raising.
+
+        Args:
+            value (str): User input to parse
+            min_value (int): Minimum valid number (non-negative)
+            max_value (int): Maximum valid number
+
+        Returns:
+            Optional[int]: Parsed number, or None if input is not a whole number in range
+        """
+        cleaned = value.strip()
+        if not cleaned.isdecimal():
+            return None
+
+        number = int(cleaned)
+        return number if min_value <= number <= max_value else None
+
     @staticmethod
     def validate_yes_no(response: str) -> bool:
         """
@@ -60,17 +97,11 @@ class MenuValidator:
         Raises:
             ValueError: If response is not a valid yes/no
         """
-        if not isinstance(response, str):
-            raise ValueError("Response must be a string")
-
         cleaned = response.strip().lower()
 
-        yes_responses = ['y', 'yes', 'true', '1']
-        no_responses = ['n', 'no', 'false', '0']
-
-        if cleaned in yes_responses:
+        if cleaned in _YES:
             return True
-        elif cleaned in no_responses:
+        elif cleaned in _NO:
             return False
         else:
             raise ValueError("Please respond with yes (y) or no (n)")
@@ -98,19 +129,17 @@ class UserValidator:
         Raises:
             ValueError: If username is invalid
         """
-        if not isinstance(username, str):
-            raise ValueError("Username must be a string")
-
         cleaned = username.strip().lower()
 
-        if len(cleaned) < 3:
-            raise ValueError("Username too short (minimum 3 characters)")
-        elif len(cleaned) > 20:
-            raise ValueError("Username too long (maximum 20 characters)")
-        elif not cleaned.isalnum():
-            raise ValueError("Username can only contain letters and numbers")
+        if _USERNAME_RE.fullmatch(cleaned):
+            return cleaned
 
-        return cleaned
+        # Invalid: work out which rule was broken for the error message
+        if len(cleaned) < _MIN_USERNAME_LENGTH:
+            raise ValueError(f"Username too short (minimum {_MIN_USERNAME_LENGTH} characters)")
+        elif len(cleaned) > _MAX_USERNAME_LENGTH:
+            raise ValueError(f"Username too long (maximum {_MAX_USERNAME_LENGTH} characters)")
+        raise ValueError("Username can only contain letters and numbers")
 
     @staticmethod
     def validate_name(name: str) -> str:
@@ -126,15 +155,12 @@ class UserValidator:
         Raises:
             ValueError: If name is invalid
         """
-        if not isinstance(name, str):
-            raise ValueError("Name must be a string")
-
         cleaned = name.strip().title()
 
-        if len(cleaned) < 2:
-            raise ValueError("Name too short (minimum 2 characters)")
-        elif len(cleaned) > 50:
-            raise ValueError("Name too long (maximum 50 characters)")
+        if len(cleaned) < _MIN_NAME_LENGTH:
+            raise ValueError(f"Name too short (minimum {_MIN_NAME_LENGTH} characters)")
+        elif len(cleaned) > _MAX_NAME_LENGTH:
+            raise ValueError(f"Name too long (maximum {_MAX_NAME_LENGTH} characters)")
         elif not cleaned.replace(" ", "").isalpha():
             raise ValueError("Name can only contain letters and spaces")
 
@@ -154,18 +180,13 @@ class UserValidator:
         Raises:
             ValueError: If age is invalid
         """
-        if not isinstance(age_str, str):
-            raise ValueError("Age must be provided as string")
-
         try:
-            age = int(age_str.strip())
+            age = int(age_str)
         except ValueError:
             raise ValueError("Age must be a valid number")
 
-        if age < 13:
-            raise ValueError("Age too young (minimum 13 years)")
-        elif age > 100:
-            raise ValueError("Age too high (maximum 100 years)")
+        if not _MIN_AGE <= age <= _MAX_AGE:
+            raise ValueError(f"Age must be between {_MIN_AGE}-{_MAX_AGE} years")
 
         return age
 
@@ -183,17 +204,13 @@ class UserValidator:
         Raises:
             ValueError: If weight is invalid
         """
-        if not isinstance(weight_str, str):
-            raise ValueError("Weight must be provided as string")
-
         try:
-            weight = float(weight_str.strip())
+            weight = float(weight_str)
         except ValueError:
             raise ValueError("Weight must be a valid number")
 
-        if weight <= 2:
-            raise ValueError("Weight must be greater than 2kg")
-        elif weight > 1000:
-            raise ValueError("Weight too high (maximum 1000kg)")
+        if not _MIN_WEIGHT_KG < weight <= _MAX_WEIGHT_KG:
+            raise ValueError(
+                f"Weight must be greater than {_MIN_WEIGHT_KG}kg and at most {_MAX_WEIGHT_KG}kg")
 
         return weight